@@ -33,12 +33,18 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, inspect
+from sqlalchemy.ext import baked
 
 logger = logging.getLogger("flask.app")
 
 # Create the SQLAlchemy object to be initialized later in init_db()
 db = SQLAlchemy()
 
+# Bakery that caches the compiled form of the find_by_* queries so
+# repeated calls skip SQL compilation and only swap bind parameters
+bakery = baked.bakery()
+
 
 def init_db(app):
     """Initialize the SQLAlchemy app"""
@@ -167,7 +173,24 @@ class Product(db.Model):
         # This is where we initialize SQLAlchemy from the Flask app
         db.init_app(app)
         app.app_context().push()
-        db.create_all()  # make our sqlalchemy tables
+        # only create the tables when the schema isn't already in place
+        if not inspect(db.engine).has_table("product"):
+            db.create_all()  # make our sqlalchemy tables
+
+    @classmethod
+    def create_all(cls, products: list):
+        """Creates a batch of Products with a single commit
+
+        :param products: the Products to create
+        :type products: list
+
+        """
+        logger.info("Creating %d Products", len(products))
+        for product in products:
+            # id must be none to generate next primary key
+            product.id = None
+        db.session.add_all(products)
+        db.session.commit()
 
     @classmethod
     def all(cls) -> list:
@@ -201,7 +224,8 @@ class Product(db.Model):
 
         """
         logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
+        query = bakery(lambda session: session.query(cls).filter(cls.name == bindparam("name")))
+        return query(db.session()).params(name=name)
 
     @classmethod
     def find_by_price(cls, price: Decimal) -> list:
@@ -218,7 +242,8 @@ class Product(db.Model):
         price_value = price
         if isinstance(price, str):
             price_value = Decimal(price.strip(' "'))
-        return cls.query.filter(cls.price == price_value)
+        query = bakery(lambda session: session.query(cls).filter(cls.price == bindparam("price")))
+        return query(db.session()).params(price=price_value)
 
     @classmethod
     def find_by_availability(cls, available: bool = True) -> list:
@@ -232,7 +257,10 @@ class Product(db.Model):
 
         """
         logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available)
+        query = bakery(
+            lambda session: session.query(cls).filter(cls.available == bindparam("available"))
+        )
+        return query(db.session()).params(available=available)
 
     @classmethod
     def find_by_category(cls, category: Category = Category.UNKNOWN) -> list:
@@ -246,4 +274,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing category query for %s ...", category.name)
-        return cls.query.filter(cls.category == category)
+        query = bakery(
+            lambda session: session.query(cls).filter(cls.category == bindparam("category"))
+        )
+        return query(db.session()).params(category=category)
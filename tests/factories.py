@@ -17,10 +17,33 @@
 """
 Test Factory to make fake objects for testing
 """
+import random
+from decimal import Decimal
+from functools import lru_cache
 import factory
-from factory.fuzzy import FuzzyChoice, FuzzyDecimal
+from factory.fuzzy import FuzzyChoice
+from faker import Faker
 from service.models import Product, Category
 
+# Fixed seeds keep the generated product data deterministic between runs
+Faker.seed(0)
+random.seed(0)
+factory.random.reseed_random(0)
+
+fake = Faker()
+
+
+@lru_cache(maxsize=1)
+def _descriptions() -> tuple:
+    """Builds the description pool once, on first use"""
+    return tuple(fake.text() for _ in range(50))
+
+
+@lru_cache(maxsize=1)
+def _prices() -> tuple:
+    """Builds the price pool once, on first use"""
+    return tuple(Decimal(str(round(random.uniform(1.0, 10000.0), 2))) for _ in range(50))
+
 
 class ProductFactory(factory.Factory):
     """Creates fake products for testing"""
@@ -46,8 +69,10 @@ class ProductFactory(factory.Factory):
             "Wrench"
         ]
     )
-    description = factory.Faker("text")
-    price = FuzzyDecimal(1.0, 10000.0, 2)
+    # building a product costs a couple of list picks from the memoized
+    # pools instead of a Faker provider call (see _descriptions/_prices)
+    description = factory.LazyFunction(lambda: random.choice(_descriptions()))
+    price = factory.LazyFunction(lambda: random.choice(_prices()))
     available = FuzzyChoice(choices=[True, False])
     category = FuzzyChoice(
         choices=[